@@ -54,6 +54,8 @@ def _serialize_schedule(doc: dict[str, Any]) -> ScheduledReportResponse:
         last_sent_at=doc.get("last_sent_at"),
         last_error=doc.get("last_error"),
         last_email_content=doc.get("last_email_content"),
+        last_email_sha256=doc.get("last_email_sha256"),
+        last_email_bytes=doc.get("last_email_bytes"),
         created_at=doc.get("created_at"),
         updated_at=doc.get("updated_at"),
         next_run_at=next_run_time(doc),
@@ -121,7 +123,7 @@ async def create_schedule(
     """Create a scheduled weekly report."""
 
     try:
-        auth_context.gitlab_client.users.get(payload.user_id)
+        user = auth_context.gitlab_client.users.get(payload.user_id)
     except gitlab.GitlabGetError as exc:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="user_not_found"
@@ -135,6 +137,7 @@ async def create_schedule(
     now = datetime.now(timezone.utc)
     schedule_doc = {
         "user_id": payload.user_id,
+        "username": user.username,
         "to": payload.to,
         "cc": payload.cc,
         "bcc": payload.bcc,
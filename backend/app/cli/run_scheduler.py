@@ -5,6 +5,11 @@ from __future__ import annotations
 import asyncio
 import logging
 
+try:  # not available on Windows or PyPy
+    import uvloop
+except ImportError:
+    uvloop = None
+
 from app.db.database import close_client, init_db
 from app.services.scheduler import (
     schedule_sync_job,
@@ -17,7 +22,7 @@ def main() -> None:
     logging.basicConfig(level=logging.INFO)
     init_db()
 
-    loop = asyncio.new_event_loop()
+    loop = uvloop.new_event_loop() if uvloop is not None else asyncio.new_event_loop()
     asyncio.set_event_loop(loop)
 
     async def _startup() -> None:
@@ -33,6 +33,7 @@ class Settings(BaseSettings):
     mail_starttls: bool = True
     mail_ssl_tls: bool = False
     use_credentials: bool | None = None
+    store_last_email_content: bool = False  # keep last report HTML for debugging
 
     app_name: str = "GitLab User Reports"
     debug: bool = False
@@ -45,6 +46,7 @@ class Settings(BaseSettings):
     require_admin_token_for_gitlab_config: bool = True
 
     performance_cache_expiry_seconds: int = 3600  # 1 hour
+    gitlab_cache_ttl_seconds: int = 300  # in-process cache for GitLab lookups
 
     llm_model_name: str = "deepseek/deepseek-v3.2"
     openrouter_api_key: str | None = None
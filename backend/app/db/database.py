@@ -8,6 +8,7 @@ from pymongo.database import Database
 from app.core.config import get_settings
 
 _client: MongoClient | None = None
+_database: Database | None = None
 
 
 def get_client() -> MongoClient:
@@ -30,17 +31,22 @@ def get_client() -> MongoClient:
 def close_client() -> None:
     """Cleanly close the MongoDB client if it has been created."""
 
-    global _client
+    global _client, _database
     if _client is not None:
         _client.close()
         _client = None
+    _database = None
 
 
 def get_database() -> Database:
     """Retrieve the configured MongoDB database."""
 
-    settings = get_settings()
-    return get_client()[settings.mongodb.database]
+    global _database
+
+    if _database is None:
+        settings = get_settings()
+        _database = get_client()[settings.mongodb.database]
+    return _database
 
 
 def init_db() -> None:
@@ -100,3 +106,4 @@ def init_db() -> None:
     scheduled_reports.create_index("active")
     scheduled_reports.create_index("day_of_week")
     scheduled_reports.create_index("manual_trigger_at")
+    scheduled_reports.create_index("updated_at")
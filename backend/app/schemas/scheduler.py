@@ -141,7 +141,14 @@ class ScheduledReportResponse(ScheduledReportBase):
     last_sent_at: datetime | None = None
     last_error: str | None = None
     last_email_content: str | None = Field(
-        default=None, description="HTML body of the last sent report."
+        default=None,
+        description="HTML body of the last sent report, when storing it is enabled.",
+    )
+    last_email_sha256: str | None = Field(
+        default=None, description="SHA-256 digest of the last sent report body."
+    )
+    last_email_bytes: int | None = Field(
+        default=None, description="Size in bytes of the last sent report body."
     )
     created_at: datetime | None = None
     updated_at: datetime | None = None
@@ -5,7 +5,10 @@ from __future__ import annotations
 from typing import Any
 
 import gitlab
+import requests
 from gitlab.exceptions import GitlabAuthenticationError, GitlabError
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from app.core.config import get_settings
 
@@ -16,13 +19,43 @@ class GitLabTokenError(Exception):
     """Raised when the GitLab admin token is missing required permissions."""
 
 
+def _retrying_session(max_retries: int) -> requests.Session:
+    """Return a session that retries transient GitLab failures a bounded number of times."""
+
+    retry = Retry(
+        total=max_retries,
+        backoff_factor=0.5,
+        status_forcelist=(500, 502, 503, 504),
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(max_retries=retry)
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
 def validate_gitlab_admin_token(
-    *, gitlab_url: str, admin_token: str
+    *,
+    gitlab_url: str,
+    admin_token: str,
+    retry_transient_errors: bool = False,
+    max_retries: int = 3,
 ) -> tuple[dict[str, Any], gitlab.Gitlab]:
-    """Validate the GitLab admin token and return user info alongside the client."""
+    """Validate the GitLab admin token and return user info alongside the client.
+
+    Retries are off by default so interactive requests fail fast; background
+    callers can opt in with ``retry_transient_errors`` and a bounded
+    ``max_retries``.
+    """
 
     try:
-        client = gitlab.Gitlab(url=gitlab_url, private_token=admin_token, timeout=15)
+        client = gitlab.Gitlab(
+            url=gitlab_url,
+            private_token=admin_token,
+            timeout=15,
+            session=_retrying_session(max_retries) if retry_transient_errors else None,
+        )
         client.auth()
         user_info = client.user.asdict()
     except (GitlabAuthenticationError, GitlabError) as exc:
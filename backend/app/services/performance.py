@@ -3,9 +3,12 @@
 from __future__ import annotations
 
 from datetime import datetime, timezone, timedelta
-from collections import defaultdict
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import Iterable, Any
 import requests
+from requests.adapters import HTTPAdapter
 import json
 from pydantic import ValidationError
 
@@ -13,6 +16,7 @@ import gitlab
 from gitlab.exceptions import GitlabError
 
 from app.core.config import get_settings
+from app.services.cache import TTLCache
 from app.schemas.performance import (
     extract_numeric_id,
     IssueInfo,
@@ -32,6 +36,23 @@ from app.schemas.performance import (
 )
 
 _UTC = timezone.utc
+_EMPTY_STATS = {"additions": 0, "deletions": 0}
+_MR_LOOKUP_WORKERS = 8
+
+# Shared session so GraphQL calls reuse pooled keep-alive connections
+_HTTP_SESSION = requests.Session()
+_HTTP_SESSION.mount("https://", HTTPAdapter(pool_connections=20, pool_maxsize=20))
+_HTTP_SESSION.mount("http://", HTTPAdapter(pool_connections=20, pool_maxsize=20))
+
+_PROJECT_STATS_CACHE: TTLCache[ProjectPerformanceResponse] = TTLCache(
+    maxsize=512, ttl=get_settings().gitlab_cache_ttl_seconds
+)
+_COMMIT_MRS_CACHE: TTLCache[list[dict]] = TTLCache(
+    maxsize=4096, ttl=get_settings().gitlab_cache_ttl_seconds
+)
+_USER_CACHE: TTLCache[gitlab.v4.objects.User] = TTLCache(
+    maxsize=1024, ttl=get_settings().gitlab_cache_ttl_seconds
+)
 
 
 class PerformanceComputationError(RuntimeError):
@@ -43,6 +64,7 @@ def _to_date(dt_obj: datetime) -> datetime:
     return datetime(dt_obj.year, dt_obj.month, dt_obj.day, tzinfo=_UTC)
 
 
+@lru_cache(maxsize=4096)
 def _parse_gitlab_datetime(value: str) -> datetime:
     """Convert GitLab ISO datetime strings into aware UTC datetime (normalize to midnight)."""
     if value.endswith("Z"):
@@ -53,6 +75,89 @@ def _parse_gitlab_datetime(value: str) -> datetime:
     return _to_date(parsed.astimezone(_UTC))
 
 
+def _commit_line_changes(commit: gitlab.v4.objects.ProjectCommit) -> tuple[int, int]:
+    """Return a commit's (additions, deletions), treating missing stats as zero."""
+    stats = getattr(commit, "stats", None) or _EMPTY_STATS
+    return stats["additions"], stats["deletions"]
+
+
+def _client_cache_key(gitlab_client: gitlab.Gitlab) -> tuple[str, str | None]:
+    """Identify a GitLab client by instance URL and token for cache keys."""
+    return gitlab_client.url, gitlab_client.private_token or gitlab_client.oauth_token
+
+
+def _get_user(gitlab_client: gitlab.Gitlab, user_id: int) -> gitlab.v4.objects.User:
+    """Return the GitLab user, memoized per client and user id."""
+    key = (_client_cache_key(gitlab_client), user_id)
+    user = _USER_CACHE.get(key)
+    if user is None:
+        user = gitlab_client.users.get(user_id)
+        _USER_CACHE.set(key, user)
+    return user
+
+
+def _get_commit_merge_requests(
+    gitlab_client: gitlab.Gitlab,
+    project_id: int,
+    commit: gitlab.v4.objects.ProjectCommit,
+) -> list[dict]:
+    """Return the merge requests containing a commit, memoized per commit SHA."""
+    key = (_client_cache_key(gitlab_client), project_id, commit.id)
+    mrs = _COMMIT_MRS_CACHE.get(key)
+    if mrs is None:
+        mrs = commit.merge_requests()
+        _COMMIT_MRS_CACHE.set(key, mrs)
+    return mrs
+
+
+def _merge_request_commit_shas(mr: gitlab.v4.objects.ProjectMergeRequest) -> list[str]:
+    """Return the SHAs of every commit in a merge request."""
+    return [mr_commit.id for mr_commit in mr.commits(iterator=True, per_page=100)]
+
+
+def _index_merge_requests_by_commit(
+    project: gitlab.v4.objects.Project,
+    since: datetime,
+    max_merge_requests: int,
+) -> dict[str, list[dict]] | None:
+    """Map commit SHAs to the project's merge requests updated since ``since``.
+
+    Returns ``None`` when the project has more candidate merge requests than
+    ``max_merge_requests``, in which case per-commit lookups are cheaper.
+    """
+    # Read x-total from a one-item page so the fallback path downloads nothing.
+    probe = project.mergerequests.list(
+        iterator=True,
+        per_page=1,
+        updated_after=since.isoformat(),
+    )
+    if probe.total is None or probe.total > max_merge_requests:
+        return None
+
+    merge_requests = project.mergerequests.list(
+        per_page=100,
+        get_all=True,
+        updated_after=since.isoformat(),
+    )
+    with ThreadPoolExecutor(max_workers=_MR_LOOKUP_WORKERS) as executor:
+        mr_commit_shas = list(executor.map(_merge_request_commit_shas, merge_requests))
+
+    sha_to_mrs: dict[str, list[dict]] = defaultdict(list)
+    for mr, commit_shas in zip(merge_requests, mr_commit_shas):
+        mr_details = mr.asdict()
+        # Like commit.merge_requests(), also match the squash and merge
+        # commits, which are not part of the MR's own commit list.
+        for sha in (
+            mr_details.get("squash_commit_sha"),
+            mr_details.get("merge_commit_sha"),
+        ):
+            if sha and sha not in commit_shas:
+                commit_shas.append(sha)
+        for sha in commit_shas:
+            sha_to_mrs[sha].append(mr_details)
+    return sha_to_mrs
+
+
 def _fetch_user_events(
     *,
     user: gitlab.v4.objects.User,
@@ -65,6 +170,7 @@ def _fetch_user_events(
             after=start.isoformat(),
             before=end.isoformat(),
             sort="asc",
+            per_page=100,
             get_all=True,
         )
     except GitlabError as exc:
@@ -77,7 +183,7 @@ def _summarize_events(
     approvals = 0
     review_comments = 0
     notes_authored = 0
-    reviewed_merge_requests: set[tuple[int | None, int | None]] = set()
+    reviewed_merge_requests: set[tuple[int, int]] = set()
     project_ids: set[int] = set()
 
     for event in events:
@@ -85,31 +191,33 @@ def _summarize_events(
         target_type = (getattr(event, "target_type", "") or "").lower()
         project_id = getattr(event, "project_id", None)
         target_id = getattr(event, "target_id", None)
+        is_merge_request = target_type == "merge_request"
+        # Only fully identified MRs count towards reviewed_merge_requests
+        review_target = (
+            (project_id, target_id)
+            if is_merge_request and project_id is not None and target_id is not None
+            else None
+        )
 
         if project_id is not None:
             project_ids.add(project_id)
 
         if "approve" in action:
             approvals += 1
-            if target_type == "merge_request":
-                reviewed_merge_requests.add((project_id, target_id))
+            if review_target is not None:
+                reviewed_merge_requests.add(review_target)
 
         if "comment" in action or target_type == "note":
             notes_authored += 1
-            if target_type == "merge_request":
+            if is_merge_request:
                 review_comments += 1
-                reviewed_merge_requests.add((project_id, target_id))
-
-    reviewed_pairs = {
-        (pid, tid)
-        for pid, tid in reviewed_merge_requests
-        if pid is not None and tid is not None
-    }
+                if review_target is not None:
+                    reviewed_merge_requests.add(review_target)
 
     code_reviews = CodeReviewStats(
         approvals_given=approvals,
         review_comments=review_comments,
-        reviewed_merge_requests=len(reviewed_pairs),
+        reviewed_merge_requests=len(reviewed_merge_requests),
         notes_authored=notes_authored,
     )
 
@@ -127,6 +235,17 @@ def get_project_performance_stats(
     if isinstance(user_emails, str):
         user_emails = [user_emails]
 
+    cache_key = (
+        _client_cache_key(gitlab_client),
+        project_id,
+        tuple(user_emails),
+        since,
+        until,
+    )
+    cached = _PROJECT_STATS_CACHE.get(cache_key)
+    if cached is not None:
+        return cached
+
     # Fetch project
     try:
         project = gitlab_client.projects.get(project_id)
@@ -141,8 +260,8 @@ def get_project_performance_stats(
         for user_email in user_emails:
             commits.extend(
                 project.commits.list(
-                    all=True,
-                    get_all=True,
+                    iterator=True,
+                    per_page=100,
                     since=since.isoformat(),
                     until=(
                         until + timedelta(days=get_settings().safe_date_offset)
@@ -151,24 +270,21 @@ def get_project_performance_stats(
                     with_stats=True,
                 )
             )
-        user_commits = [
-            commit
-            for commit in commits
-            if commit.author_email in user_emails
-            and _parse_gitlab_datetime(commit.authored_date) >= since
-            and _parse_gitlab_datetime(commit.authored_date) <= until
-            and len(commit.parent_ids) < 2  # Exclude merge commits
-        ]
+        # (authored_date, commit) pairs; each authored_date is parsed only once
+        user_commits: list[tuple[datetime, gitlab.v4.objects.ProjectCommit]] = []
+        for commit in commits:
+            if commit.author_email not in user_emails or len(commit.parent_ids) >= 2:
+                continue  # Exclude other authors and merge commits
+            authored_dt = _parse_gitlab_datetime(commit.authored_date)
+            if since <= authored_dt <= until:
+                user_commits.append((authored_dt, commit))
     except GitlabError as exc:
         raise PerformanceComputationError(
             f"Failed to fetch commits for project ID {project_id}"
         ) from exc
 
     # Sort commits by authored date
-    sorted_commits = sorted(
-        user_commits,
-        key=lambda c: _parse_gitlab_datetime(c.authored_date),
-    )
+    dated_commits = sorted(user_commits, key=lambda item: item[0])
 
     # mr_iid -> (mr_details_dict, [commit_ids_for_this_user])
     merge_requests: dict[int, tuple[dict, list[str]]] = {}
@@ -181,15 +297,40 @@ def get_project_performance_stats(
     daily_deletions: dict[datetime, int] = defaultdict(int)
     daily_changes: dict[datetime, int] = defaultdict(int)
 
-    for commit in sorted_commits:
-        stats = commit.stats or {}
-        num_additions = stats.get("additions", 0)
-        num_deletions = stats.get("deletions", 0)
+    # Resolve each commit's MRs up front: list the window's MRs once and join
+    # locally when that takes fewer requests, otherwise look commits up
+    # concurrently
+    commit_mrs: list[list[dict]] = []
+    if dated_commits:
+        try:
+            sha_to_mrs = _index_merge_requests_by_commit(
+                project, since, max_merge_requests=len(dated_commits)
+            )
+            if sha_to_mrs is not None:
+                commit_mrs = [
+                    sha_to_mrs.get(commit.id, []) for _, commit in dated_commits
+                ]
+            else:
+                with ThreadPoolExecutor(max_workers=_MR_LOOKUP_WORKERS) as executor:
+                    commit_mrs = list(
+                        executor.map(
+                            lambda commit: _get_commit_merge_requests(
+                                gitlab_client, project_id, commit
+                            ),
+                            (commit for _, commit in dated_commits),
+                        )
+                    )
+        except GitlabError as exc:
+            raise PerformanceComputationError(
+                f"Failed to fetch merge requests for project ID {project_id}"
+            ) from exc
+
+    for (authored_dt, commit), mrs in zip(dated_commits, commit_mrs):
+        num_additions, num_deletions = _commit_line_changes(commit)
 
         total_additions += num_additions
         total_deletions += num_deletions
 
-        authored_dt = _parse_gitlab_datetime(commit.authored_date)
         # If you prefer day-level buckets, use authored_dt.date() instead
         daily_commit_counts[authored_dt] += 1
         daily_additions[authored_dt] += num_additions
@@ -197,33 +338,29 @@ def get_project_performance_stats(
         daily_changes[authored_dt] += num_additions + num_deletions
 
         # Collect MRs per commit
-        try:
-            mrs = commit.merge_requests()
-            for mr in mrs:
-                mr_iid = int(mr["iid"])
-                if mr_iid not in merge_requests:
-                    merge_requests[mr_iid] = (mr, [])
-                merge_requests[mr_iid][1].append(commit.id)
-        except GitlabError as exc:
-            raise PerformanceComputationError(
-                f"Failed to fetch merge requests for project ID {project_id}"
-            ) from exc
+        for mr in mrs:
+            mr_iid = int(mr["iid"])
+            if mr_iid not in merge_requests:
+                merge_requests[mr_iid] = (mr, [])
+            merge_requests[mr_iid][1].append(commit.id)
 
     total_commits = len(user_commits)
     total_changes = total_additions + total_deletions
 
     merge_request_details: list[MergeRequestDetails] = []
+    commits_by_id = {
+        commit.id: (authored_dt, commit) for authored_dt, commit in user_commits
+    }
 
     for mr_details, commit_ids in merge_requests.values():
-        # User's commits in this MR
-        mr_user_commits = [commit for commit in user_commits if commit.id in commit_ids]
+        # User's commits in this MR (ids were collected in authored-date order)
+        mr_user_commits = [commits_by_id[commit_id] for commit_id in commit_ids]
 
-        mr_total_additions = sum(
-            (commit.stats or {}).get("additions", 0) for commit in mr_user_commits
-        )
-        mr_total_deletions = sum(
-            (commit.stats or {}).get("deletions", 0) for commit in mr_user_commits
-        )
+        mr_line_changes = [
+            _commit_line_changes(commit) for _, commit in mr_user_commits
+        ]
+        mr_total_additions = sum(additions for additions, _ in mr_line_changes)
+        mr_total_deletions = sum(deletions for _, deletions in mr_line_changes)
 
         merge_request_details.append(
             MergeRequestDetails(
@@ -246,17 +383,19 @@ def get_project_performance_stats(
                         title=commit.title,
                         message=commit.message,
                         web_url=commit.web_url,
-                        authored_date=_parse_gitlab_datetime(commit.authored_date),
-                        additions=(commit.stats or {}).get("additions", 0),
-                        deletions=(commit.stats or {}).get("deletions", 0),
+                        authored_date=authored_dt,
+                        additions=additions,
+                        deletions=deletions,
+                    )
+                    for (authored_dt, commit), (additions, deletions) in zip(
+                        mr_user_commits, mr_line_changes
                     )
-                    for commit in mr_user_commits
                 ]
                 or None,
             )
         )
 
-    return ProjectPerformanceResponse(
+    project_stats = ProjectPerformanceResponse(
         id=project.id,
         name=project.name,
         avatar_url=getattr(project, "avatar_url", None),
@@ -279,6 +418,8 @@ def get_project_performance_stats(
         daily_deletions=dict(daily_deletions),
         daily_changes=dict(daily_changes),
     )
+    _PROJECT_STATS_CACHE.set(cache_key, project_stats)
+    return project_stats
 
 
 def summarize_user_performance(
@@ -290,7 +431,7 @@ def summarize_user_performance(
     additional_user_emails: list[str] = [],
 ) -> GeneralUserPerformance:
     """Build an aggregated view of a developer's performance across projects."""
-    user = gitlab_client.users.get(user_id)
+    user = _get_user(gitlab_client, user_id)
     user_emails = [user.email] + additional_user_emails
 
     # Fetch and summarize events
@@ -302,10 +443,10 @@ def summarize_user_performance(
     total_commits = 0
     total_additions = 0
     total_deletions = 0
-    daily_commit_counts: dict[datetime, int] = defaultdict(int)
-    daily_additions: dict[str, int] = defaultdict(int)
-    daily_deletions: dict[str, int] = defaultdict(int)
-    daily_changes: dict[str, int] = defaultdict(int)
+    daily_commit_counts: Counter[datetime] = Counter()
+    daily_additions: Counter[datetime] = Counter()
+    daily_deletions: Counter[datetime] = Counter()
+    daily_changes: Counter[datetime] = Counter()
     mr_references: set[str] = set()
     for project_id in involved_project_ids:
         project_stats = get_project_performance_stats(
@@ -326,14 +467,10 @@ def summarize_user_performance(
                 mr.reference for mr in project_stats.merge_requests if mr.reference
             )
 
-        for date, count in project_stats.daily_commit_counts.items():
-            daily_commit_counts[date] += count
-        for date, adds in project_stats.daily_additions.items():
-            daily_additions[date] += adds
-        for date, dels in project_stats.daily_deletions.items():
-            daily_deletions[date] += dels
-        for date, changes in project_stats.daily_changes.items():
-            daily_changes[date] += changes
+        daily_commit_counts.update(project_stats.daily_commit_counts)
+        daily_additions.update(project_stats.daily_additions)
+        daily_deletions.update(project_stats.daily_deletions)
+        daily_changes.update(project_stats.daily_changes)
 
     total_changes = total_additions + total_deletions
 
@@ -377,6 +514,136 @@ def summarize_user_performance(
     )
 
 
+def _build_timelog_node(node: dict) -> TimelogNode | None:
+    """Convert a raw GraphQL timelog node, or return None if it is malformed."""
+    project_raw = node.get("project") or {}
+
+    project = ProjectInfo(
+        id=project_raw.get("id"),
+        name=(project_raw.get("name") or "Not provided"),
+        avatar_url=project_raw.get("avatarUrl"),
+        web_url=project_raw.get("webUrl"),
+        path_with_namespace=project_raw.get("fullPath"),
+        name_with_namespace=project_raw.get("nameWithNamespace"),
+    )
+
+    issue_obj = None
+    if node.get("issue"):
+        issue_raw = node["issue"]
+        issue_obj = IssueInfo(
+            iid=issue_raw.get("iid"),
+            title=issue_raw.get("title"),
+            web_url=issue_raw.get("webUrl"),
+            state=issue_raw.get("state"),
+            reference=issue_raw.get("reference"),
+        )
+
+    mr_obj = None
+    if node.get("mergeRequest"):
+        mr_raw = node["mergeRequest"]
+        mr_obj = MergeRequestInfo(
+            iid=mr_raw.get("iid"),
+            title=mr_raw.get("title"),
+            web_url=mr_raw.get("webUrl"),
+            state=mr_raw.get("state"),
+            reference=mr_raw.get("reference"),
+        )
+
+    try:
+        return TimelogNode(
+            id=node.get("id"),
+            project=project,
+            time_spent=node.get("timeSpent") or 0,
+            spent_at=node.get("spentAt"),
+            summary=node.get("summary"),
+            issue=issue_obj,
+            merge_request=mr_obj,
+        )
+    except ValidationError:
+        # Skip malformed nodes rather than failing the whole computation
+        # (or log this somewhere if you prefer)
+        return None
+
+
+# Collapsed to single spaces once at import to keep the request body small
+_TIMELOG_QUERY = " ".join(
+    """
+query timeTrackingReport(
+    $startTime: Time,
+    $endTime: Time,
+    $projectId: ProjectID,
+    $groupId: GroupID,
+    $username: String,
+    $first: Int,
+    $last: Int,
+    $before: String,
+    $after: String
+) {
+    timelogs(
+        startTime: $startTime
+        endTime: $endTime
+        projectId: $projectId
+        groupId: $groupId
+        username: $username
+        first: $first
+        last: $last
+        after: $after
+        before: $before
+        sort: SPENT_AT_DESC
+    ) {
+        count
+        totalSpentTime
+        nodes {
+            id
+            project {
+                id
+                name
+                avatarUrl
+                webUrl
+                fullPath
+                nameWithNamespace
+            }
+            timeSpent
+            user {
+                id
+                name
+                username
+                avatarUrl
+                webPath
+            }
+            spentAt
+            note {
+                id
+                body
+            }
+            summary
+            issue {
+                iid
+                title
+                webUrl
+                state
+                reference
+            }
+            mergeRequest {
+                iid
+                title
+                webUrl
+                state
+                reference
+            }
+        }
+        pageInfo {
+            hasNextPage
+            hasPreviousPage
+            startCursor
+            endCursor
+        }
+    }
+}
+""".split()
+)
+
+
 def get_time_spent_stats(
     gitlab_token: str,
     gitlab_base_url: str,
@@ -390,81 +657,6 @@ def get_time_spent_stats(
 
     graph_ql_url = f"{gitlab_base_url}/api/graphql"
 
-    query = """
-    query timeTrackingReport(
-        $startTime: Time,
-        $endTime: Time,
-        $projectId: ProjectID,
-        $groupId: GroupID,
-        $username: String,
-        $first: Int,
-        $last: Int,
-        $before: String,
-        $after: String
-    ) {
-        timelogs(
-            startTime: $startTime
-            endTime: $endTime
-            projectId: $projectId
-            groupId: $groupId
-            username: $username
-            first: $first
-            last: $last
-            after: $after
-            before: $before
-            sort: SPENT_AT_DESC
-        ) {
-            count
-            totalSpentTime
-            nodes {
-                id
-                project {
-                    id
-                    name
-                    avatarUrl
-                    webUrl
-                    fullPath
-                    nameWithNamespace
-                }
-                timeSpent
-                user {
-                    id
-                    name
-                    username
-                    avatarUrl
-                    webPath
-                }
-                spentAt
-                note {
-                    id
-                    body
-                }
-                summary
-                issue {
-                    iid
-                    title
-                    webUrl
-                    state
-                    reference
-                }
-                mergeRequest {
-                    iid
-                    title
-                    webUrl
-                    state
-                    reference
-                }
-            }
-            pageInfo {
-                hasNextPage
-                hasPreviousPage
-                startCursor
-                endCursor
-            }
-        }
-    }
-    """
-
     headers = {
         "Authorization": f"Bearer {gitlab_token}",
         "Content-Type": "application/json",
@@ -488,9 +680,9 @@ def get_time_spent_stats(
         }
 
         try:
-            response = requests.post(
+            response = _HTTP_SESSION.post(
                 graph_ql_url,
-                json={"query": query, "variables": variables},
+                json={"query": _TIMELOG_QUERY, "variables": variables},
                 headers=headers,
             )
         except requests.RequestException as exc:
@@ -547,58 +739,11 @@ def get_time_spent_stats(
         )
 
     # Build TimelogNode objects
-    timelog_nodes: list[TimelogNode] = []
-
-    for node in all_nodes:
-        project_raw = node.get("project") or {}
-
-        project = ProjectInfo(
-            id=project_raw.get("id"),
-            name=(project_raw.get("name") or "Not provided"),
-            avatar_url=project_raw.get("avatarUrl"),
-            web_url=project_raw.get("webUrl"),
-            path_with_namespace=project_raw.get("fullPath"),
-            name_with_namespace=project_raw.get("nameWithNamespace"),
-        )
-
-        issue_obj = None
-        if node.get("issue"):
-            issue_raw = node["issue"]
-            issue_obj = IssueInfo(
-                iid=issue_raw.get("iid"),
-                title=issue_raw.get("title"),
-                web_url=issue_raw.get("webUrl"),
-                state=issue_raw.get("state"),
-                reference=issue_raw.get("reference"),
-            )
-
-        mr_obj = None
-        if node.get("mergeRequest"):
-            mr_raw = node["mergeRequest"]
-            mr_obj = MergeRequestInfo(
-                iid=mr_raw.get("iid"),
-                title=mr_raw.get("title"),
-                web_url=mr_raw.get("webUrl"),
-                state=mr_raw.get("state"),
-                reference=mr_raw.get("reference"),
-            )
-
-        try:
-            timelog = TimelogNode(
-                id=node.get("id"),
-                project=project,
-                time_spent=node.get("timeSpent") or 0,
-                spent_at=node.get("spentAt"),
-                summary=node.get("summary"),
-                issue=issue_obj,
-                merge_request=mr_obj,
-            )
-        except ValidationError as exc:
-            # Skip malformed nodes rather than failing the whole computation
-            # (or log this somewhere if you prefer)
-            continue
-
-        timelog_nodes.append(timelog)
+    timelog_nodes = [
+        timelog
+        for timelog in map(_build_timelog_node, all_nodes)
+        if timelog is not None
+    ]
 
     if not timelog_nodes:
         return TimeSpentStats(
@@ -616,21 +761,20 @@ def get_time_spent_stats(
     user_id = extract_numeric_id(first_user.get("id", "0"))
 
     # Aggregate: daily_project_time_spent
-    # key: (date, project_fullpath) → hours
-    daily_proj_hours: dict[tuple[datetime, str], float] = defaultdict(float)
+    # key: (date, project_fullpath) → seconds, converted to hours once below
+    daily_proj_seconds: dict[tuple[datetime, str], int] = defaultdict(int)
 
     for tl in timelog_nodes:
         # group by UTC date (drop time)
         day = tl.spent_at.date()
         # Represent as datetime at midnight UTC for the model's datetime type
         day_dt = datetime(day.year, day.month, day.day, tzinfo=tl.spent_at.tzinfo)
-        hours = tl.time_spent / 3600.0
-        daily_proj_hours[(day_dt, tl.project.path_with_namespace)] += hours
+        daily_proj_seconds[(day_dt, tl.project.path_with_namespace)] += tl.time_spent
 
     daily_project_time_spent: list[tuple[datetime, str, float]] = [
-        (day_dt, project_fullpath, hours)
-        for (day_dt, project_fullpath), hours in sorted(
-            daily_proj_hours.items(), key=lambda x: (x[0][0], x[0][1])
+        (day_dt, project_fullpath, seconds / 3600.0)
+        for (day_dt, project_fullpath), seconds in sorted(
+            daily_proj_seconds.items(), key=lambda x: (x[0][0], x[0][1])
         )
     ]
 
@@ -702,21 +846,22 @@ def summarize_project_performance(
     # Fetch commits of project in the given time range for all users
     try:
         commits = project.commits.list(
-            all=True,
-            get_all=True,
+            iterator=True,
+            per_page=100,
             since=start_date.isoformat(),
             until=(
                 end_date + timedelta(days=get_settings().safe_date_offset)
             ).isoformat(),
             with_stats=True,
         )
-        project_commits = [
-            commit
-            for commit in commits
-            if _parse_gitlab_datetime(commit.authored_date) >= start_date
-            and _parse_gitlab_datetime(commit.authored_date) <= end_date
-            and len(commit.parent_ids) < 2  # Exclude merge commits
-        ]
+        # (authored_date, commit) pairs; each authored_date is parsed only once
+        project_commits: list[tuple[datetime, gitlab.v4.objects.ProjectCommit]] = []
+        for commit in commits:
+            if len(commit.parent_ids) >= 2:
+                continue  # Exclude merge commits
+            authored_dt = _parse_gitlab_datetime(commit.authored_date)
+            if start_date <= authored_dt <= end_date:
+                project_commits.append((authored_dt, commit))
     except GitlabError as exc:
         raise PerformanceComputationError(
             f"Failed to fetch commits for project ID {project_id}"
@@ -731,15 +876,12 @@ def summarize_project_performance(
 
     contributors: dict[str, ProjectContributorStats] = {}
 
-    for commit in project_commits:
-        stats = commit.stats or {}
-        num_additions = stats.get("additions", 0)
-        num_deletions = stats.get("deletions", 0)
+    for authored_dt, commit in project_commits:
+        num_additions, num_deletions = _commit_line_changes(commit)
 
         total_additions += num_additions
         total_deletions += num_deletions
 
-        authored_dt = _parse_gitlab_datetime(commit.authored_date)
         daily_commit_counts[authored_dt] += 1
         daily_additions[authored_dt] += num_additions
         daily_deletions[authored_dt] += num_deletions
@@ -789,7 +931,7 @@ def get_user_performance_for_llm(
 ) -> str:
     """Return a summary of the user's performance for use with a language model in json format."""
 
-    user = gitlab_client.users.get(user_id)
+    user = _get_user(gitlab_client, user_id)
     user_emails = [user.email] + additional_user_emails
 
     # 1. Highlights: Approvals and Comments via Events
@@ -903,8 +1045,8 @@ def get_user_performance_for_llm(
             for email in user_emails:
                 commits.extend(
                     project.commits.list(
-                        all=True,
-                        get_all=True,
+                        iterator=True,
+                        per_page=100,
                         since=start_date.isoformat(),
                         until=(
                             end_date + +timedelta(days=get_settings().safe_date_offset)
@@ -924,9 +1066,7 @@ def get_user_performance_for_llm(
                         valid_commits.append((c, c_date_obj))
 
             for commit, commit_date_obj in valid_commits:
-                stats = commit.stats or {}
-                adds = stats.get("additions", 0)
-                rems = stats.get("deletions", 0)
+                adds, rems = _commit_line_changes(commit)
 
                 highlights["total_commits"] += 1
                 highlights["add_lines"] += adds
@@ -941,7 +1081,9 @@ def get_user_performance_for_llm(
                 }
 
                 try:
-                    associated_mrs = commit.merge_requests()
+                    associated_mrs = _get_commit_merge_requests(
+                        gitlab_client, pid, commit
+                    )
                 except Exception:
                     associated_mrs = []
 
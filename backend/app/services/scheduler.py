@@ -3,24 +3,30 @@
 from __future__ import annotations
 
 import asyncio
+import hashlib
 import logging
-from datetime import datetime, timedelta, timezone
+import time
+from datetime import date, datetime, timedelta, timezone
 import jdatetime
 import markdown
-from functools import lru_cache
+from functools import cache, lru_cache
 from typing import Any
 
+from apscheduler.jobstores.base import JobLookupError
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
 from bson import ObjectId
 from fastapi_mail import ConnectionConfig, FastMail, MessageSchema
 from jinja2 import BaseLoader, Environment, select_autoescape
+from pymongo import UpdateOne
 
 from app.core.config import get_settings
 from app.db.database import get_database
+from app.services.cache import TTLCache
 from app.services.gitlab import GitLabTokenError, validate_gitlab_admin_token
 from app.services.performance import (
     PerformanceComputationError,
+    _get_user,
     get_time_spent_stats,
     summarize_user_performance,
     get_user_performance_for_llm,
@@ -30,6 +36,15 @@ from app.agents import PerformancePrompt, PerformanceAgent
 logger = logging.getLogger(__name__)
 
 _scheduler = AsyncIOScheduler(timezone=timezone.utc)
+_ERROR_DEDUPE_SECONDS = 60
+_GITLAB_MAX_RETRIES = 3
+# schedule id -> (last error written, monotonic time it was written)
+_recorded_errors: dict[ObjectId, tuple[str, float]] = {}
+# Validated admin clients keyed by (gitlab_url, token); schedules that fire
+# together share one token validation.
+_GITLAB_CLIENT_CACHE: TTLCache[Any] = TTLCache(
+    maxsize=4, ttl=get_settings().gitlab_cache_ttl_seconds
+)
 
 
 def _to_jalali(dt: datetime) -> jdatetime.datetime:
@@ -38,9 +53,31 @@ def _to_jalali(dt: datetime) -> jdatetime.datetime:
     return jdatetime.datetime.fromgregorian(datetime=dt)
 
 
+def _utc_day(dt: datetime) -> tuple[int, int, int]:
+    if dt.tzinfo is not None:
+        dt = dt.astimezone(timezone.utc)
+    return dt.year, dt.month, dt.day
+
+
+# Report rows repeat the same handful of days, so day-granular conversions
+# are memoized by (year, month, day).
+@lru_cache(maxsize=1024)
+def _jalali_date_str(year: int, month: int, day: int) -> str:
+    return jdatetime.date.fromgregorian(year=year, month=month, day=day).strftime(
+        "%Y-%m-%d"
+    )
+
+
+@lru_cache(maxsize=1024)
+def _jalali_weekday_str(year: int, month: int, day: int) -> str:
+    return jdatetime.date.fromgregorian(year=year, month=month, day=day).strftime(
+        "%A"
+    )
+
+
 def _format_jalali_date(dt: datetime) -> str:
     """Return a Jalali date string for display."""
-    return _to_jalali(dt).strftime("%Y-%m-%d")
+    return _jalali_date_str(*_utc_day(dt))
 
 
 def _format_jalali_datetime(dt: datetime) -> str:
@@ -50,7 +87,7 @@ def _format_jalali_datetime(dt: datetime) -> str:
 
 def _jalali_weekday(dt: datetime) -> str:
     """Return the Jalali weekday name for display."""
-    return _to_jalali(dt).strftime("%A")
+    return _jalali_weekday_str(*_utc_day(dt))
 
 
 def _extract_timelog_mr_refs(time_spent: Any | None) -> set[str]:
@@ -68,20 +105,75 @@ def _extract_timelog_mr_refs(time_spent: Any | None) -> set[str]:
     return refs
 
 
-def _aggregate_hours_by_day(time_spent: Any | None) -> dict[str, float]:
-    """Sum time-spent hours keyed by YYYY-MM-DD."""
-    hours: dict[str, float] = {}
+def _aggregate_hours_by_day(time_spent: Any | None) -> dict[date, float]:
+    """Sum time-spent hours keyed by calendar day."""
+    hours: dict[date, float] = {}
     if not time_spent:
         return hours
 
-    for date, _project, num_hours in getattr(
+    for day, _project, num_hours in getattr(
         time_spent, "daily_project_time_spent", []
     ):
-        date_key = date.date().isoformat()
+        date_key = day.date()
         hours[date_key] = hours.get(date_key, 0.0) + float(num_hours)
     return hours
 
 
+def _day_labels(days: list[datetime]) -> dict[datetime, tuple[str, str]]:
+    """Map each day to its (Jalali date, weekday) display strings."""
+    return {day: (_format_jalali_date(day), _jalali_weekday(day)) for day in set(days)}
+
+
+def _daily_activity_rows(
+    perf: Any,
+    hours_by_day: dict[date, float],
+    labels: dict[datetime, tuple[str, str]],
+) -> list[tuple[str, str, int, int, str]]:
+    """Build the sorted (date, weekday, commits, changes, hours) daily rows."""
+    daily_changes = perf.daily_changes
+    return [
+        (
+            *labels[day],
+            commits,
+            daily_changes.get(day, 0),
+            f"{hours_by_day.get(day.date(), 0):.1f}",
+        )
+        for day, commits in sorted(perf.daily_commit_counts.items())
+    ]
+
+
+def _time_spent_rows(
+    time_spent: Any | None, labels: dict[datetime, tuple[str, str]]
+) -> list[tuple[str, str, str, str]]:
+    """Build the (date, weekday, project, hours) rows of the time-spent table."""
+    if not time_spent:
+        return []
+    return [
+        (*labels[day], project, f"{hours:.1f}")
+        for day, project, hours in time_spent.daily_project_time_spent
+    ]
+
+
+def _project_rows(
+    perf: Any, project_hours: dict[str, float]
+) -> list[tuple[str | None, str, int, int, int, str]]:
+    """Flatten project performances into (url, name, commits, changes, MRs, hours)."""
+    rows = []
+    for proj in perf.project_performances:
+        project_key = proj.path_with_namespace or proj.web_url or str(proj.id)
+        rows.append(
+            (
+                proj.web_url,
+                proj.name_with_namespace or proj.name,
+                proj.commits,
+                proj.changes,
+                proj.mr_contributed,
+                f"{project_hours.get(project_key, 0):.1f}",
+            )
+        )
+    return rows
+
+
 def _project_hours_map(time_spent: Any | None) -> dict[str, float]:
     """Map project path to total hours from timelogs."""
     project_hours: dict[str, float] = {}
@@ -105,11 +197,23 @@ def _project_hours_map(time_spent: Any | None) -> dict[str, float]:
     return project_hours
 
 
-_EMAIL_TEMPLATE = Environment(
+_EMAIL_ENV = Environment(
     loader=BaseLoader(),
     autoescape=select_autoescape(enabled_extensions=("html",)),
-).from_string(
-    """
+    # Drop the indentation and newlines around block tags from the output.
+    trim_blocks=True,
+    lstrip_blocks=True,
+    auto_reload=False,
+)
+# Template helpers are bound once here instead of being passed on every render.
+_EMAIL_ENV.globals.update(
+    jalali_date=_format_jalali_date,
+    jalali_datetime=_format_jalali_datetime,
+)
+
+# The <head> and closing tags never change, so they are kept as plain strings
+# and only the <body> goes through Jinja.
+_EMAIL_HEAD = """
     <!DOCTYPE html>
     <html>
     <head>
@@ -150,7 +254,14 @@ _EMAIL_TEMPLATE = Environment(
         }
     </style>
     </head>
-    <body style="background-color: #f4f7fa; font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Helvetica, Arial, sans-serif; padding: 20px 0;">
+"""
+
+_EMAIL_FOOT = """
+    </html>
+    """
+
+_EMAIL_TEMPLATE = _EMAIL_ENV.from_string(
+    """    <body style="background-color: #f4f7fa; font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Helvetica, Arial, sans-serif; padding: 20px 0;">
         
         <div style="max-width: 760px; margin: 0 auto; background-color: #ffffff; border-radius: 8px; overflow: hidden; box-shadow: 0 4px 6px rgba(0,0,0,0.05); border: 1px solid #e1e4e8;">
             
@@ -190,7 +301,7 @@ _EMAIL_TEMPLATE = Environment(
                             <div style="font-size: 11px; color: #7f8c8d; text-transform: uppercase; margin-top: 4px;">Issues WithTimeLog</div>
                         </td>
                         <td width="25%" style="text-align: center; padding: 10px;">
-                            <div style="font-size: 24px; font-weight: 700; color: #2c3e50;">{{ "%.1f" | format(total_hours or 0) }}</div>
+                            <div style="font-size: 24px; font-weight: 700; color: #2c3e50;">{{ total_hours }}</div>
                             <div style="font-size: 11px; color: #7f8c8d; text-transform: uppercase; margin-top: 4px;">Total Hours</div>
                         </td>
                     </tr>
@@ -221,12 +332,12 @@ _EMAIL_TEMPLATE = Environment(
                         </tr>
                     </thead>
                     <tbody>
-                    {% for date, project, hours in time_spent.daily_project_time_spent %}
+                    {% for day, weekday, project, hours in time_spent_rows %}
                         <tr>
-                            <td style="padding: 8px; border-bottom: 1px solid #e9ecef; color: #495057;">{{ jalali_date(date) }}</td>
-                            <td style="padding: 8px; border-bottom: 1px solid #e9ecef; color: #495057;">{{ weekday_name(date) }}</td>
+                            <td style="padding: 8px; border-bottom: 1px solid #e9ecef; color: #495057;">{{ day }}</td>
+                            <td style="padding: 8px; border-bottom: 1px solid #e9ecef; color: #495057;">{{ weekday }}</td>
                             <td style="padding: 8px; border-bottom: 1px solid #e9ecef; font-weight: 500; color: #24292e;">{{ project }}</td>
-                            <td style="padding: 8px; border-bottom: 1px solid #e9ecef; text-align: right; color: #24292e;">{{ "%.1f"|format(hours) }}</td>
+                            <td style="padding: 8px; border-bottom: 1px solid #e9ecef; text-align: right; color: #24292e;">{{ hours }}</td>
                         </tr>
                     {% endfor %}
                     </tbody>
@@ -250,19 +361,18 @@ _EMAIL_TEMPLATE = Environment(
                         </tr>
                     </thead>
                     <tbody>
-                    {% for date, commits in perf.daily_commit_counts|dictsort %}
+                    {% for day, weekday, commits, changes, hours in daily_rows %}
                         <tr>
-                            {% set date_key = date.strftime("%Y-%m-%d") %}
-                            <td style="padding: 8px; border-bottom: 1px solid #e9ecef; color: #495057;">{{ jalali_date(date) }}</td>
-                            <td style="padding: 8px; border-bottom: 1px solid #e9ecef; color: #495057;">{{ weekday_name(date) }}</td>
+                            <td style="padding: 8px; border-bottom: 1px solid #e9ecef; color: #495057;">{{ day }}</td>
+                            <td style="padding: 8px; border-bottom: 1px solid #e9ecef; color: #495057;">{{ weekday }}</td>
                             <td style="padding: 8px; border-bottom: 1px solid #e9ecef; text-align: right;">
                                 <span style="background: #e1e4e8; padding: 2px 6px; border-radius: 10px; font-size: 11px;">{{ commits }}</span>
                             </td>
                             <td style="padding: 8px; border-bottom: 1px solid #e9ecef; text-align: right; color: #24292e;">
-                                {{ perf.daily_changes.get(date, 0) }}
+                                {{ changes }}
                             </td>
                             <td style="padding: 8px; border-bottom: 1px solid #e9ecef; text-align: right; color: #24292e;">
-                                {{ "%.1f"|format(hours_by_day.get(date_key, 0)) }}
+                                {{ hours }}
                             </td>
                         </tr>
                     {% endfor %}
@@ -286,18 +396,17 @@ _EMAIL_TEMPLATE = Environment(
                         </tr>
                     </thead>
                     <tbody>
-                    {% for proj in perf.project_performances %}
+                    {% for web_url, name, commits, changes, mrs, hours in project_rows %}
                         <tr>
                             <td style="padding: 8px; border-bottom: 1px solid #e9ecef;">
-                                <a href="{{ proj.web_url }}" style="color: #0366d6; text-decoration: none; font-weight: 500;">
-                                    {{ proj.name_with_namespace or proj.name }}
+                                <a href="{{ web_url }}" style="color: #0366d6; text-decoration: none; font-weight: 500;">
+                                    {{ name }}
                                 </a>
                             </td>
-                            <td style="padding: 8px; border-bottom: 1px solid #e9ecef; text-align: right; color: #586069;">{{ proj.commits }}</td>
-                            <td style="padding: 8px; border-bottom: 1px solid #e9ecef; text-align: right; color: #586069;">{{ proj.changes }}</td>
-                            <td style="padding: 8px; border-bottom: 1px solid #e9ecef; text-align: right; color: #586069;">{{ proj.mr_contributed }}</td>
-                            {% set proj_key = proj.path_with_namespace or proj.web_url or (proj.id ~ "") %}
-                            <td style="padding: 8px; border-bottom: 1px solid #e9ecef; text-align: right; color: #586069;">{{ "%.1f"|format(project_hours.get(proj_key, 0)) }}</td>
+                            <td style="padding: 8px; border-bottom: 1px solid #e9ecef; text-align: right; color: #586069;">{{ commits }}</td>
+                            <td style="padding: 8px; border-bottom: 1px solid #e9ecef; text-align: right; color: #586069;">{{ changes }}</td>
+                            <td style="padding: 8px; border-bottom: 1px solid #e9ecef; text-align: right; color: #586069;">{{ mrs }}</td>
+                            <td style="padding: 8px; border-bottom: 1px solid #e9ecef; text-align: right; color: #586069;">{{ hours }}</td>
                         </tr>
                     {% endfor %}
                     </tbody>
@@ -327,9 +436,30 @@ _EMAIL_TEMPLATE = Environment(
             </div>
             
         </div>
-    </body>
-    </html>
-    """
+    </body>"""
+)
+
+
+_NO_ACTIVITY_TEMPLATE = _EMAIL_ENV.from_string(
+    """    <body style="background-color: #f4f7fa; font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Helvetica, Arial, sans-serif; padding: 20px 0;">
+        <div style="max-width: 760px; margin: 0 auto; background-color: #ffffff; border-radius: 8px; overflow: hidden; border: 1px solid #e1e4e8;">
+            <div style="background-color: #24292e; padding: 24px 30px; text-align: center;">
+                <h1 style="color: #ffffff; margin: 0; font-size: 20px; font-weight: 600;">Weekly Performance</h1>
+                <p style="color: #a3aab1; margin: 8px 0 0 0; font-size: 14px;">{{ perf.username }}</p>
+                <p style="color: #ffffff; margin: 12px 0 0 0; font-size: 12px;">
+                    {{ jalali_date(start_date) }} — {{ jalali_date(end_date) }}
+                </p>
+            </div>
+            <div style="padding: 30px; text-align: center; color: #586069; font-size: 14px;">
+                No commits, merge requests, reviews or logged time in this period.
+            </div>
+            <div style="background-color: #f8f9fa; padding: 15px; text-align: center; border-top: 1px solid #e1e4e8;">
+                <p style="margin: 0; color: #959da5; font-size: 11px;">
+                    Generated at {{ jalali_datetime(now_utc) }} (Jalali)
+                </p>
+            </div>
+        </div>
+    </body>"""
 )
 
 
@@ -338,16 +468,14 @@ def _job_id(schedule_id: ObjectId | str) -> str:
 
 
 def _normalize_object_id(value: str | ObjectId) -> ObjectId:
-    if isinstance(value, ObjectId):
-        return value
-    return ObjectId(str(value))
+    return value if isinstance(value, ObjectId) else ObjectId(value)
 
 
 def _now_utc() -> datetime:
     return datetime.now(timezone.utc)
 
 
-@lru_cache(maxsize=1)
+@cache
 def _get_mail_client() -> FastMail:
     """Build and cache the FastMail client."""
 
@@ -383,9 +511,7 @@ def _get_mail_client() -> FastMail:
     return FastMail(mail_conf)
 
 
-def _get_gitlab_client():
-    mongo_db = get_database()
-    app_config = mongo_db["app_user_config"].find_one({})
+def _get_gitlab_client(app_config: dict[str, Any] | None):
     if not app_config:
         logger.warning("GitLab admin token is not configured; skipping scheduled email")
         return None
@@ -396,28 +522,119 @@ def _get_gitlab_client():
         logger.warning("GitLab admin token is missing; skipping scheduled email")
         return None
 
-    try:
-        gitlab_user_info, gitlab_client = validate_gitlab_admin_token(
-            gitlab_url=gitlab_url,
-            admin_token=gitlab_token,
-        )
-        app_config["gitlab_user_info"] = gitlab_user_info
-        return app_config, gitlab_client
-    except GitLabTokenError as exc:
-        logger.error("GitLab admin token validation failed: %s", exc)
+    cache_key = (gitlab_url, gitlab_token)
+    gitlab_client = _GITLAB_CLIENT_CACHE.get(cache_key)
+    if gitlab_client is None:
+        try:
+            _, gitlab_client = validate_gitlab_admin_token(
+                gitlab_url=gitlab_url,
+                admin_token=gitlab_token,
+                retry_transient_errors=True,
+                max_retries=_GITLAB_MAX_RETRIES,
+            )
+        except GitLabTokenError as exc:
+            logger.error("GitLab admin token validation failed: %s", exc)
+            return None
+        _GITLAB_CLIENT_CACHE.set(cache_key, gitlab_client)
+
+    return app_config, gitlab_client
+
+
+def _load_schedule(
+    schedule_id: ObjectId,
+) -> tuple[dict[str, Any], dict[str, Any] | None, list[str]] | None:
+    """Load a schedule together with the app config and the user's extra emails.
+
+    Everything the job reads up front is fetched in a single aggregation so a
+    run costs one MongoDB round trip instead of three.
+    """
+
+    mongo_db = get_database()
+    pipeline = [
+        {"$match": {"_id": schedule_id}},
+        {"$limit": 1},
+        {"$project": {"last_email_content": 0}},
+        {
+            "$lookup": {
+                "from": "app_user_config",
+                "pipeline": [{"$limit": 1}],
+                "as": "_app_config",
+            }
+        },
+        {
+            "$lookup": {
+                "from": "user_performance_settings",
+                "localField": "user_id",
+                "foreignField": "user_id",
+                "as": "_performance_settings",
+            }
+        },
+    ]
+    schedule = next(mongo_db["scheduled_reports"].aggregate(pipeline), None)
+    if not schedule:
         return None
 
+    app_configs = schedule.pop("_app_config", [])
+    settings_docs = schedule.pop("_performance_settings", [])
+    app_config = app_configs[0] if app_configs else None
+    additional_user_emails = (
+        settings_docs[0].get("additional_user_emails", []) if settings_docs else []
+    )
+    return schedule, app_config, additional_user_emails
 
-def _get_additional_user_emails(user_id: int) -> list[str]:
-    mongo_db = get_database()
-    settings_doc = mongo_db["user_performance_settings"].find_one({"user_id": user_id})
-    return settings_doc.get("additional_user_emails", []) if settings_doc else []
 
+async def _record_last_error(schedule_id: ObjectId, error: str) -> None:
+    # Repeated identical failures (e.g. a bad token across retries) are
+    # written once per window instead of on every attempt.
+    now = time.monotonic()
+    previous = _recorded_errors.get(schedule_id)
+    if previous and previous[0] == error and now - previous[1] < _ERROR_DEDUPE_SECONDS:
+        return
+    _recorded_errors[schedule_id] = (error, now)
 
-def _record_last_error(schedule_id: ObjectId, error: str) -> None:
     mongo_db = get_database()
-    mongo_db["scheduled_reports"].update_one(
-        {"_id": schedule_id}, {"$set": {"last_error": error, "updated_at": _now_utc()}}
+    await asyncio.to_thread(
+        mongo_db["scheduled_reports"].update_one,
+        {"_id": schedule_id},
+        {"$set": {"last_error": error, "updated_at": _now_utc()}},
+    )
+
+
+def _schedule_username(gitlab_client: Any, schedule: dict[str, Any]) -> str:
+    """Return the username stored on the schedule, resolving and saving it if unset."""
+
+    username = schedule.get("username")
+    if not username:
+        # Shares the user cache that summarize_user_performance reads.
+        username = _get_user(gitlab_client, int(schedule["user_id"])).username
+        _save_schedule_username(schedule, username)
+    return username
+
+
+def _save_schedule_username(schedule: dict[str, Any], username: str) -> None:
+    """Store ``username`` on the schedule document and the in-memory copy."""
+
+    schedule["username"] = username
+    get_database()["scheduled_reports"].update_one(
+        {"_id": schedule["_id"]}, {"$set": {"username": username}}
+    )
+
+
+def _fetch_time_spent(
+    gitlab_client: Any,
+    app_config: dict[str, Any],
+    schedule: dict[str, Any],
+    start_date: datetime,
+    end_date: datetime,
+) -> Any:
+    """Resolve the user's username and fetch their logged time for the window."""
+
+    return get_time_spent_stats(
+        gitlab_base_url=app_config["gitlab_url"],
+        gitlab_token=app_config["gitlab_admin_token"],
+        username=_schedule_username(gitlab_client, schedule),
+        start_time=start_date,
+        end_time=end_date,
     )
 
 
@@ -430,23 +647,90 @@ def _render_email_body(
     *,
     mrs_touched: int = 0,
     total_hours: float | None = None,
-    hours_by_day: dict[str, float] | None = None,
+    hours_by_day: dict[date, float] | None = None,
     project_hours: dict[str, float] | None = None,
+    now: datetime | None = None,
 ) -> str:
-    return _EMAIL_TEMPLATE.render(
+    # Each distinct day is converted to Jalali once and shared by both tables.
+    timelog_days = (
+        [row[0] for row in time_spent.daily_project_time_spent] if time_spent else []
+    )
+    labels = _day_labels([*perf.daily_commit_counts, *timelog_days])
+    body = _EMAIL_TEMPLATE.render(
         perf=perf,
+        daily_rows=_daily_activity_rows(perf, hours_by_day or {}, labels),
+        time_spent_rows=_time_spent_rows(time_spent, labels),
         time_spent=time_spent,
         start_date=start_date,
         end_date=end_date,
-        now_utc=_now_utc(),
-        jalali_date=_format_jalali_date,
-        jalali_datetime=_format_jalali_datetime,
+        now_utc=now or _now_utc(),
         llm_summary=llm_summary,
         mrs_touched=mrs_touched,
-        total_hours=total_hours,
-        hours_by_day=hours_by_day or {},
-        project_hours=project_hours or {},
-        weekday_name=_jalali_weekday,
+        total_hours=f"{total_hours or 0:.1f}",
+        project_rows=_project_rows(perf, project_hours or {}),
+    )
+    return "".join((_EMAIL_HEAD, body, _EMAIL_FOOT))
+
+
+def _render_no_activity_body(
+    perf: Any, start_date: datetime, end_date: datetime, now: datetime
+) -> str:
+    body = _NO_ACTIVITY_TEMPLATE.render(
+        perf=perf, start_date=start_date, end_date=end_date, now_utc=now
+    )
+    return "".join((_EMAIL_HEAD, body, _EMAIL_FOOT))
+
+
+async def _summarize_with_llm(
+    schedule_id: str,
+    gitlab_client: Any,
+    user_id: int,
+    start_date: datetime,
+    end_date: datetime,
+    additional_user_emails: list[str],
+) -> str | None:
+    """Return the LLM summary of the user's week as HTML, or None on failure."""
+
+    try:
+        llm_performance = await asyncio.to_thread(
+            get_user_performance_for_llm,
+            gitlab_client=gitlab_client,
+            user_id=user_id,
+            start_date=start_date,
+            end_date=end_date,
+            additional_user_emails=additional_user_emails,
+        )
+        agent = PerformanceAgent(
+            model_name=get_settings().llm_model_name,
+            openrouter_api_key=get_settings().openrouter_api_key,
+        )
+        performance_summary = await agent.summarize_performance(
+            llm_performance, PerformancePrompt
+        )
+        logger.info(
+            "LLM performance summary for schedule %s: %s",
+            schedule_id,
+            performance_summary,
+        )
+        return markdown.markdown(
+            performance_summary, extensions=["tables", "nl2br", "fenced_code"]
+        )
+    except Exception as exc:  # pragma: no cover - external API failure
+        logger.error(
+            "Failed to summarize performance for schedule %s: %s", schedule_id, exc
+        )
+        return None
+
+
+def _has_activity(perf: Any, total_hours: float) -> bool:
+    """Whether the week has anything worth summarizing."""
+    return bool(
+        perf.commits
+        or perf.mr_contributed
+        or perf.approvals_given
+        or perf.review_merge_requests
+        or perf.notes_authored
+        or total_hours
     )
 
 
@@ -460,11 +744,14 @@ async def send_scheduled_report(schedule_id: str) -> None:
         return
 
     mongo_db = get_database()
-    schedule = mongo_db["scheduled_reports"].find_one({"_id": schedule_object_id})
-    if not schedule:
+    # pymongo is blocking; keep MongoDB round trips off the event loop so
+    # concurrent jobs are not stalled behind them.
+    loaded = await asyncio.to_thread(_load_schedule, schedule_object_id)
+    if not loaded:
         logger.warning("Schedule %s not found; removing job", schedule_id)
         remove_schedule_job(schedule_id)
         return
+    schedule, app_config, additional_user_emails = loaded
 
     if not schedule.get("active", True):
         remove_schedule_job(schedule_id)
@@ -475,49 +762,77 @@ async def send_scheduled_report(schedule_id: str) -> None:
         logger.warning("Schedule %s has no recipients; skipping", schedule_id)
         return
 
-    gitlab_info = _get_gitlab_client()
+    gitlab_info = await asyncio.to_thread(_get_gitlab_client, app_config)
     if gitlab_info is None:
-        _record_last_error(schedule_object_id, "GitLab admin token is not configured")
+        await _record_last_error(
+            schedule_object_id, "GitLab admin token is not configured"
+        )
         return
 
     app_config, gitlab_client = gitlab_info
-    start_date = _now_utc() - timedelta(days=7)
-    end_date = _now_utc()
-    time_spent = None
-
-    try:
-        performance = summarize_user_performance(
+    now = _now_utc()
+    start_date = now - timedelta(days=7)
+    end_date = now
+
+    user_id = int(schedule["user_id"])
+    # Both aggregations are independent GitLab round trips; overlap them.
+    performance, time_spent = await asyncio.gather(
+        asyncio.to_thread(
+            summarize_user_performance,
             gitlab_client=gitlab_client,
-            user_id=int(schedule["user_id"]),
+            user_id=user_id,
             start_date=start_date,
             end_date=end_date,
-            additional_user_emails=_get_additional_user_emails(
-                int(schedule["user_id"])
-            ),
-        )
-    except PerformanceComputationError as exc:
+            additional_user_emails=additional_user_emails,
+        ),
+        asyncio.to_thread(
+            _fetch_time_spent,
+            gitlab_client,
+            app_config,
+            schedule,
+            start_date,
+            end_date,
+        ),
+        return_exceptions=True,
+    )
+
+    if isinstance(performance, PerformanceComputationError):
         logger.error(
-            "Failed to compute performance for schedule %s: %s", schedule_id, exc
+            "Failed to compute performance for schedule %s: %s",
+            schedule_id,
+            performance,
         )
-        _record_last_error(schedule_object_id, str(exc))
+        await _record_last_error(schedule_object_id, str(performance))
         return
-    except Exception as exc:  # pragma: no cover - defensive
-        logger.exception("Unexpected error computing performance for %s", schedule_id)
-        _record_last_error(schedule_object_id, str(exc))
+    if isinstance(performance, BaseException):  # pragma: no cover - defensive
+        logger.error(
+            "Unexpected error computing performance for %s",
+            schedule_id,
+            exc_info=performance,
+        )
+        await _record_last_error(schedule_object_id, str(performance))
         return
 
-    try:
-        user = gitlab_client.users.get(int(schedule["user_id"]))
-        time_spent = get_time_spent_stats(
-            gitlab_base_url=app_config["gitlab_url"],
-            gitlab_token=app_config["gitlab_admin_token"],
-            username=user.username,
-            start_time=start_date,
-            end_time=end_date,
-        )
-    except Exception as exc:  # pragma: no cover - external API failure
+    # A renamed user's timelogs live under the new name; refresh the stored
+    # one from the cached user lookup and refetch with it.
+    if performance.username != schedule.get("username"):
+        await asyncio.to_thread(_save_schedule_username, schedule, performance.username)
+        try:
+            time_spent = await asyncio.to_thread(
+                _fetch_time_spent,
+                gitlab_client,
+                app_config,
+                schedule,
+                start_date,
+                end_date,
+            )
+        except Exception as exc:  # pragma: no cover - external API failure
+            time_spent = exc
+
+    time_spent_failed = isinstance(time_spent, BaseException)
+    if time_spent_failed:  # pragma: no cover - external API failure
         logger.error(
-            "Failed to compute time spent for schedule %s: %s", schedule_id, exc
+            "Failed to compute time spent for schedule %s: %s", schedule_id, time_spent
         )
         time_spent = None
 
@@ -530,42 +845,25 @@ async def send_scheduled_report(schedule_id: str) -> None:
         float(getattr(time_spent, "total_time_spent_hours", 0.0)) if time_spent else 0.0
     )
 
-    try:
-        llm_performance = get_user_performance_for_llm(
-            gitlab_client=gitlab_client,
-            user_id=int(schedule["user_id"]),
-            start_date=start_date,
-            end_date=end_date,
-            additional_user_emails=_get_additional_user_emails(
-                int(schedule["user_id"])
-            ),
-        )
-        agent = PerformanceAgent(
-            model_name=get_settings().llm_model_name,
-            openrouter_api_key=get_settings().openrouter_api_key,
-        )
-        performance_summary = await agent.summarize_performance(
-            llm_performance, PerformancePrompt
-        )
-        logger.info(
-            "LLM performance summary for schedule %s: %s",
+    # Idle weeks skip the LLM call and the full report render. Without the
+    # time-spent data the week cannot be called idle, so render it in full.
+    has_activity = time_spent_failed or _has_activity(performance, total_hours)
+    llm_summary_html = None
+    if has_activity:
+        llm_summary_html = await _summarize_with_llm(
             schedule_id,
-            performance_summary,
-        )
-        llm_summary_html = markdown.markdown(
-            performance_summary, extensions=["tables", "nl2br", "fenced_code"]
+            gitlab_client,
+            user_id,
+            start_date,
+            end_date,
+            additional_user_emails,
         )
-    except Exception as exc:  # pragma: no cover - external API failure
-        logger.error(
-            "Failed to summarize performance for schedule %s: %s", schedule_id, exc
-        )
-        llm_summary_html = None
 
     try:
         mail_client = _get_mail_client()
     except RuntimeError as exc:
         logger.error("Email configuration error: %s", exc)
-        _record_last_error(schedule_object_id, str(exc))
+        await _record_last_error(schedule_object_id, str(exc))
         return
 
     subject = (
@@ -575,17 +873,21 @@ async def send_scheduled_report(schedule_id: str) -> None:
     # Add start and end dates to subject
     subject += f" ({_format_jalali_date(start_date)} — {_format_jalali_date(end_date)})"
 
-    body = _render_email_body(
-        performance,
-        time_spent,
-        start_date,
-        end_date,
-        llm_summary_html,
-        mrs_touched=mrs_touched,
-        total_hours=total_hours,
-        hours_by_day=hours_by_day,
-        project_hours=project_hours,
-    )
+    if has_activity:
+        body = _render_email_body(
+            performance,
+            time_spent,
+            start_date,
+            end_date,
+            llm_summary_html,
+            mrs_touched=mrs_touched,
+            total_hours=total_hours,
+            hours_by_day=hours_by_day,
+            project_hours=project_hours,
+            now=now,
+        )
+    else:
+        body = _render_no_activity_body(performance, start_date, end_date, now)
     message = MessageSchema(
         subject=subject,
         recipients=recipients,
@@ -599,37 +901,68 @@ async def send_scheduled_report(schedule_id: str) -> None:
         # write in database for now for debugging purposes
         logger.info("Sending email for schedule %s to %s", schedule_id, recipients)
         await mail_client.send_message(message)
-        mongo_db["scheduled_reports"].update_one(
+        sent_at = _now_utc()
+        _recorded_errors.pop(schedule_object_id, None)
+        encoded_body = body.encode()
+        report_fields: dict[str, Any] = {
+            "last_sent_at": sent_at,
+            "last_error": None,
+            "updated_at": sent_at,
+            # A digest and size are enough to tell sends apart; the full HTML
+            # is only kept when explicitly enabled for debugging.
+            "last_email_sha256": hashlib.sha256(encoded_body).hexdigest(),
+            "last_email_bytes": len(encoded_body),
+        }
+        if get_settings().store_last_email_content:
+            update = {"$set": {**report_fields, "last_email_content": body}}
+        else:
+            update = {"$set": report_fields, "$unset": {"last_email_content": ""}}
+        await asyncio.to_thread(
+            mongo_db["scheduled_reports"].update_one,
             {"_id": schedule_object_id},
-            {
-                "$set": {
-                    "last_sent_at": _now_utc(),
-                    "last_error": None,
-                    "updated_at": _now_utc(),
-                    "last_email_content": body,
-                }
-            },
+            update,
         )
         logger.info("Sent weekly performance report for schedule %s", schedule_id)
     except Exception as exc:  # pragma: no cover - external service failure
         logger.error("Failed to send email for schedule %s: %s", schedule_id, exc)
-        _record_last_error(schedule_object_id, str(exc))
+        await _record_last_error(schedule_object_id, str(exc))
+
 
+@lru_cache(maxsize=256)
+def _build_cron(day_of_week: str | int, hour: int, minute: int) -> CronTrigger:
+    """Build (and memoize) the weekly UTC trigger for a schedule slot."""
 
-def _register_job(schedule: dict[str, Any]) -> None:
-    """Create or refresh an APScheduler job from a schedule document."""
+    return CronTrigger(
+        day_of_week=day_of_week,
+        hour=hour,
+        minute=minute,
+        timezone=timezone.utc,
+    )
+
+
+def _schedule_trigger(schedule: dict[str, Any]) -> CronTrigger:
+    return _build_cron(
+        schedule.get("day_of_week", "mon"),
+        int(schedule.get("hour_utc", 7)),
+        int(schedule.get("minute_utc", 0)),
+    )
+
+
+def _register_job(schedule: dict[str, Any], schedule_id: str | None = None) -> None:
+    """Create or refresh an APScheduler job from a schedule document.
+
+    ``schedule_id`` is the string form of ``schedule["_id"]`` when the caller
+    already has it.
+    """
 
-    schedule_id = str(schedule["_id"])
     if not schedule.get("active", True):
         return
+    if schedule_id is None:
+        schedule_id = str(schedule["_id"])
 
-    trigger = CronTrigger(
-        day_of_week=schedule.get("day_of_week", "mon"),
-        hour=int(schedule.get("hour_utc", 7)),
-        minute=int(schedule.get("minute_utc", 0)),
-        timezone=timezone.utc,
-    )
+    trigger = _schedule_trigger(schedule)
 
+    _known_schedule_ids.add(schedule_id)
     _scheduler.add_job(
         send_scheduled_report,
         trigger=trigger,
@@ -641,55 +974,107 @@ def _register_job(schedule: dict[str, Any]) -> None:
     )
 
 
+# Only the fields needed to (re)register jobs are shipped on each sync tick.
+_SYNC_PROJECTION = {
+    "_id": 1,
+    "active": 1,
+    "day_of_week": 1,
+    "hour_utc": 1,
+    "minute_utc": 1,
+    "manual_trigger_at": 1,
+}
+# Between full syncs only schedules whose updated_at moved are re-read. The
+# lookback absorbs clock skew between the API and scheduler processes.
+_SYNC_LOOKBACK = timedelta(minutes=5)
+_FULL_SYNC_INTERVAL = timedelta(minutes=15)
+_last_sync_at: datetime | None = None
+_last_full_sync_at: datetime | None = None
+# Schedules that currently have jobs registered by this process, so stale
+# ones are found by a set difference instead of scanning every job.
+_known_schedule_ids: set[str] = set()
+
+
 def sync_scheduled_jobs() -> None:
-    """Read schedules from MongoDB and ensure matching jobs exist."""
+    """Read schedules from MongoDB and ensure matching jobs exist.
+
+    Every API write bumps ``updated_at``, so most ticks only fetch changed
+    schedules. A periodic full sync catches anything else, such as deleted
+    documents; a job whose schedule was deleted also removes itself when it
+    fires.
+    """
+
+    global _last_sync_at, _last_full_sync_at
 
     mongo_db = get_database()
+    now = _now_utc()
+    full_sync = (
+        _last_sync_at is None
+        or _last_full_sync_at is None
+        or now - _last_full_sync_at >= _FULL_SYNC_INTERVAL
+    )
+    if full_sync:
+        query: dict[str, Any] = {"active": {"$ne": False}}
+    else:
+        query = {"updated_at": {"$gte": _last_sync_at - _SYNC_LOOKBACK}}
+
     active_ids: set[str] = set()
-    manual_triggers: list[tuple[str, ObjectId]] = []
+    manual_triggers: list[tuple[str, ObjectId, datetime]] = []
 
-    for schedule in mongo_db["scheduled_reports"].find({}):
+    schedules = mongo_db["scheduled_reports"].find(query, projection=_SYNC_PROJECTION)
+    for schedule in schedules:
         schedule_id = str(schedule["_id"])
-        is_active = schedule.get("active", True)
-        if schedule.get("manual_trigger_at") and is_active:
-            manual_triggers.append((schedule_id, schedule["_id"]))
+        if not schedule.get("active", True):
+            remove_schedule_job(schedule_id)
+            continue
+        if schedule.get("manual_trigger_at"):
+            manual_triggers.append(
+                (schedule_id, schedule["_id"], schedule["manual_trigger_at"])
+            )
 
-        if is_active:
-            active_ids.add(schedule_id)
-            _register_job(schedule)
+        active_ids.add(schedule_id)
+        _register_job(schedule, schedule_id)
 
     # Remove jobs for deleted/inactive schedules
-    for job in _scheduler.get_jobs():
-        if not job.id.startswith("user-performance-report-"):
-            continue
-        sid = job.id.replace("user-performance-report-", "").replace("-manual", "")
-        if sid not in active_ids:
-            job.remove()
+    if full_sync:
+        for schedule_id in _known_schedule_ids - active_ids:
+            remove_schedule_job(schedule_id)
+        _last_full_sync_at = now
+    _last_sync_at = now
 
     # Queue manual triggers
-    for schedule_id, object_id in manual_triggers:
+    clear_ops: list[UpdateOne] = []
+    for schedule_id, object_id, triggered_at in manual_triggers:
         _scheduler.add_job(
             send_scheduled_report,
             trigger="date",
-            run_date=_now_utc(),
+            run_date=now,
             id=f"{_job_id(schedule_id)}-manual",
             kwargs={"schedule_id": schedule_id},
             replace_existing=True,
             max_instances=1,
         )
-        mongo_db["scheduled_reports"].update_one(
-            {"_id": object_id},
-            {"$set": {"manual_trigger_at": None, "updated_at": _now_utc()}},
+        # Only clear the trigger we acted on; a newer request made while this
+        # tick was running stays queued for the next one.
+        clear_ops.append(
+            UpdateOne(
+                {"_id": object_id, "manual_trigger_at": triggered_at},
+                {"$set": {"manual_trigger_at": None, "updated_at": now}},
+            )
         )
+    if clear_ops:
+        mongo_db["scheduled_reports"].bulk_write(clear_ops, ordered=False)
 
 
 def remove_schedule_job(schedule_id: str) -> None:
     """Remove all jobs from the scheduler for a schedule id."""
 
+    _known_schedule_ids.discard(schedule_id)
     base_id = _job_id(schedule_id)
-    for job in _scheduler.get_jobs():
-        if job.id.startswith(base_id):
-            job.remove()
+    for job_id in (base_id, f"{base_id}-manual"):
+        try:
+            _scheduler.remove_job(job_id)
+        except JobLookupError:
+            pass
 
 
 def upsert_schedule_job(schedule: dict[str, Any]) -> None:
@@ -730,12 +1115,7 @@ def next_run_time(schedule: dict[str, Any]) -> datetime | None:
 
     if not schedule.get("active", True):
         return None
-    trigger = CronTrigger(
-        day_of_week=schedule.get("day_of_week", "mon"),
-        hour=int(schedule.get("hour_utc", 7)),
-        minute=int(schedule.get("minute_utc", 0)),
-        timezone=timezone.utc,
-    )
+    trigger = _schedule_trigger(schedule)
     return trigger.get_next_fire_time(None, _now_utc())
 
 
@@ -747,7 +1127,8 @@ def run_schedule_now(schedule_id: str) -> None:
         oid = _normalize_object_id(schedule_id)
     except Exception:
         return
+    now = _now_utc()
     mongo_db["scheduled_reports"].update_one(
         {"_id": oid},
-        {"$set": {"manual_trigger_at": _now_utc(), "updated_at": _now_utc()}},
+        {"$set": {"manual_trigger_at": now, "updated_at": now}},
     )